@@ -10,21 +10,28 @@ import math
 import time
 import json
 import logging
+import functools
+from collections import namedtuple
 from datetime import datetime, timezone
 
 # ── Qt imports ───────────────────────────────────────────────────────────────
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QListWidget, QListWidgetItem, QProgressBar,
+    QLabel, QPushButton, QListView, QAbstractItemView, QProgressBar,
     QStackedWidget, QFrame, QSizePolicy, QScrollArea,
 )
 from PyQt5.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QSize, QPropertyAnimation,
-    QEasingCurve, QRect, pyqtProperty, QObject,
+    QEasingCurve, QRect, pyqtProperty, QObject, pyqtSlot, QMetaObject, QUrl,
+    QStringListModel, QEvent,
+)
+from PyQt5.QtNetwork import (
+    QTcpSocket, QAbstractSocket, QNetworkAccessManager, QNetworkRequest, QNetworkReply,
 )
 from PyQt5.QtGui import (
     QFont, QFontDatabase, QColor, QPalette, QPixmap, QPainter,
-    QLinearGradient, QBrush, QRadialGradient, QPen, QIcon,
+    QLinearGradient, QBrush, QRadialGradient, QPen, QIcon, QPixmapCache,
+    QFontMetrics,
 )
 
 # ── Optional deps (graceful fallback) ────────────────────────────────────────
@@ -35,10 +42,10 @@ except ImportError:
     MPD_AVAILABLE = False
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    from PyQt5.QtWebSockets import QWebSocket      # apt: python3-pyqt5.qtwebsockets
+    WEBSOCKETS_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    WEBSOCKETS_AVAILABLE = False
 
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 log = logging.getLogger("CustomPlayer")
@@ -52,14 +59,22 @@ MOPIDY_HOST     = "localhost"
 MOPIDY_MPD_PORT = 6600
 POLL_INTERVAL_MS_SPOTIFY  = 2000
 POLL_INTERVAL_MS_PRINTER  = 5000
-POLL_INTERVAL_MS_SKYBLOCK = 500
+POLL_INTERVAL_MS_SKYBLOCK = 1000    # base UI tick, aligned to whole seconds; the polls run on multiples of it
+TICK_SLACK_MS             = 60      # > 5 % coarse-timer slack on a 1 s tick
+TICKS_PER_SPOTIFY_POLL    = POLL_INTERVAL_MS_SPOTIFY // POLL_INTERVAL_MS_SKYBLOCK
+TICKS_PER_PRINTER_POLL    = POLL_INTERVAL_MS_PRINTER // POLL_INTERVAL_MS_SKYBLOCK
 
 # Skyblock epoch: 11 June 2019 UTC (ms)
 SB_EPOCH_MS          = 1560275700000
+SB_EPOCH_S           = SB_EPOCH_MS // 1000   # whole seconds
 SB_REAL_MIN_PER_DAY  = 20          # 20 real minutes = 1 SB day
 SB_DAYS_PER_MONTH    = 31
 SB_HOURS_PER_DAY     = 24
 FREE_WILL_CYCLE_HRS  = 96          # configurable
+SB_SEC_PER_REAL_SEC  = SB_HOURS_PER_DAY * 3600 // (SB_REAL_MIN_PER_DAY * 60)  # 72, exact
+
+PIXMAP_CACHE_KB      = 4096        # QPixmapCache budget (Qt default is 10 MB)
+FW_ANCHOR_PATH       = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".fw_anchor")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COLOUR PALETTE  (dark, Spotify-inspired but more industrial/refined)
@@ -81,6 +96,10 @@ C = {
     "cold":         "#44aaff",
 }
 
+# Same palette as ready-made QColors, so paint code never re-parses hex strings
+QC = {k: QColor(v) for k, v in C.items()}
+QC_ACCENT_ALPHA40 = QColor(0x1d, 0xb9, 0x54, 0x40)     # accent at 25% – cover glow
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MOCK / FALLBACK DATA
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -185,59 +204,108 @@ class InputHandler(QObject):
 # WORKER: Mopidy / MPD
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class MopidyWorker(QThread):
+class MopidyWorker(QObject):
+    """
+    Lives on the shared I/O thread (see MainWindow._wire_workers).
+    Polls are requested by MainWindow's tick via poll_now() – no sleep loop.
+
+    A second MPD connection sits in `idle` (see _start_idle), so
+    state/option/playlist changes arrive immediately.
+    The timed poll is then only needed while playing (elapsed time).
+    """
     track_updated    = pyqtSignal(dict)
     playlists_updated= pyqtSignal(list)
     error            = pyqtSignal(str)
 
+    # Control requests are marshalled onto the I/O thread via this signal
+    _command         = pyqtSignal(str, object)
+
+    PLAYLISTS_EVERY_N_POLLS = 10        # listplaylists rarely changes – every ~20 s
+    KEEPALIVE_EVERY_N_POLLS = 15        # ping while paused, well inside MPD's 60 s timeout
+    IDLE_SUBSYSTEMS = ("player", "options", "stored_playlist")
+
     def __init__(self):
         super().__init__()
-        self._running  = True
         self._client   = None
         self._connected= False
+        self._polls    = 0
+        self._quiet_polls = 0           # polls skipped since the command link last talked
+        self._playing  = False
+        self._idle_sock   = None            # second connection, parked in `idle`
+        self._idle_active = False
+        self._idle_changed= []
+        self._command.connect(self._safe_cmd, Qt.QueuedConnection)   # UI → I/O thread
+
+        # cmd → handler(arg); looked up once per command in _safe_cmd
+        self._cmd_table = {
+            "play_pause":    self._do_play_pause,
+            "next":          lambda a: self._client.next(),
+            "previous":      lambda a: self._client.previous(),
+            "random":        lambda a: self._client.random(1 if a else 0),
+            "repeat":        lambda a: self._client.repeat(1 if a else 0),
+            "load_playlist": self._do_load_playlist,
+        }
 
     # ── Public control methods (called from UI thread) ────────────────────────
-    def play_pause(self):   self._safe_cmd("play_pause")
-    def next_track(self):   self._safe_cmd("next")
-    def prev_track(self):   self._safe_cmd("previous")
-    def shuffle(self, on):  self._safe_cmd("random", on)
-    def loop(self, on):     self._safe_cmd("repeat",  on)
-    def play_playlist(self, name): self._safe_cmd("load_playlist", name)
-
-    def _safe_cmd(self, cmd, *args):
+    def play_pause(self):   self._command.emit("play_pause", ())
+    def next_track(self):   self._command.emit("next", ())
+    def prev_track(self):   self._command.emit("previous", ())
+    def shuffle(self, on):  self._command.emit("random", (on,))
+    def loop(self, on):     self._command.emit("repeat",  (on,))
+    def play_playlist(self, name): self._command.emit("load_playlist", (name,))
+
+    @pyqtSlot(str, object)
+    def _safe_cmd(self, cmd, args):
         if not self._connected:
             return
+        fn = self._cmd_table.get(cmd)
+        if fn is None:
+            return
         try:
-            if cmd == "play_pause":
-                status = self._client.status()
-                if status.get("state") == "play":
-                    self._client.pause(1)
-                else:
-                    self._client.play()
-            elif cmd == "next":
-                self._client.next()
-            elif cmd == "previous":
-                self._client.previous()
-            elif cmd == "random":
-                self._client.random(1 if args[0] else 0)
-            elif cmd == "repeat":
-                self._client.repeat(1 if args[0] else 0)
-            elif cmd == "load_playlist":
-                self._client.clear()
-                self._client.load(args[0])
-                self._client.play()
+            fn(args[0] if args else None)
+            if not self._idle_active:
+                # No idle connection to report the change – repoll right away
+                # instead of leaving the UI stale until the next tick
+                self._poll_status()
         except Exception as e:
             log.warning(f"MPD cmd {cmd} failed: {e}")
-            self._connected = False
+            self._disconnect()
 
-    # ── Thread loop ───────────────────────────────────────────────────────────
-    def run(self):
-        while self._running:
+    def _do_play_pause(self, _):
+        status = self._client.status()
+        if status.get("state") == "play":
+            self._client.pause(1)
+        else:
+            self._client.play()
+
+    def _do_load_playlist(self, name):
+        self._client.clear()
+        self._client.load(name)
+        self._client.play()
+
+    # ── Event-driven polling (runs on the I/O thread) ─────────────────────────
+    @pyqtSlot()
+    def poll_now(self):
+        if not self._connected:
+            self._try_connect()
             if not self._connected:
-                self._try_connect()
-            if self._connected:
-                self._poll()
-            time.sleep(POLL_INTERVAL_MS_SPOTIFY / 1000)
+                return
+        elif self._idle_active and not self._playing:
+            # Paused/stopped: the idle connection reports any change, but MPD
+            # drops a client silent for connection_timeout – keep this one alive
+            self._quiet_polls += 1
+            if self._quiet_polls >= self.KEEPALIVE_EVERY_N_POLLS:
+                self._keepalive()
+            return
+        self._poll()
+
+    def _keepalive(self):
+        self._quiet_polls = 0
+        try:
+            self._client.ping()
+        except Exception as e:
+            log.warning(f"MPD ping failed: {e}")
+            self._disconnect()
 
     def _try_connect(self):
         if not MPD_AVAILABLE:
@@ -249,95 +317,302 @@ class MopidyWorker(QThread):
             self._client.timeout = 3
             self._client.connect(MOPIDY_HOST, MOPIDY_MPD_PORT)
             self._connected = True
+            self._polls     = 0             # refresh playlists on (re)connect
             log.info("MPD connected")
         except Exception as e:
             log.debug(f"MPD connect failed: {e}")
             self.track_updated.emit(MOCK_TRACK.copy())
             self.playlists_updated.emit(MOCK_PLAYLISTS.copy())
+            return
+        self._start_idle()
+
+    def _start_idle(self):
+        # Raw MPD protocol over a QTcpSocket: only `idle` is ever sent, and
+        # readyRead fires on the I/O thread's event loop – nothing blocks.
+        self._idle_sock    = QTcpSocket(self)
+        self._idle_changed = []
+        self._idle_sock.readyRead.connect(self._on_idle_ready)
+        self._idle_sock.disconnected.connect(self._on_idle_lost)
+        self._idle_sock.errorOccurred.connect(self._on_idle_lost)
+        self._idle_sock.connectToHost(MOPIDY_HOST, MOPIDY_MPD_PORT)
+
+    def _send_idle(self):
+        self._idle_sock.write(b"idle " + " ".join(self.IDLE_SUBSYSTEMS).encode() + b"\n")
+
+    @pyqtSlot()
+    def _on_idle_ready(self):
+        while self._idle_sock is not None and self._idle_sock.canReadLine():
+            line = bytes(self._idle_sock.readLine()).decode("utf-8", "replace").strip()
+            if line.startswith("OK MPD "):          # greeting
+                self._idle_active = True
+                self._send_idle()
+            elif line.startswith("changed: "):
+                self._idle_changed.append(line[9:])
+            elif line == "OK":
+                changed, self._idle_changed = self._idle_changed, []
+                self._on_changed(changed)
+                if self._idle_sock is not None:
+                    self._send_idle()
+            elif line.startswith("ACK"):
+                log.warning(f"MPD idle error: {line}")
+                self._on_idle_lost()
+
+    def _on_changed(self, changed):
+        try:
+            if "player" in changed or "options" in changed:
+                self._poll_status()
+            if "stored_playlist" in changed:
+                self._poll_playlists()
+        except Exception as e:
+            log.warning(f"MPD poll error: {e}")
+            self._disconnect()
+
+    @pyqtSlot()
+    def _on_idle_lost(self):
+        # Fall back to timed polling; that also notices if MPD itself is gone
+        self._idle_active = False
+        self._drop_idle_sock()
+
+    def _drop_idle_sock(self):
+        if self._idle_sock is not None:
+            self._idle_sock.blockSignals(True)
+            self._idle_sock.abort()
+            self._idle_sock.deleteLater()
+            self._idle_sock = None
 
     def _poll(self):
+        self._quiet_polls = 0
         try:
-            status   = self._client.status()
-            currentsong = self._client.currentsong()
-            playlists   = [p["playlist"] for p in self._client.listplaylists()]
-
-            track = {
-                "title":    currentsong.get("title", "Unknown"),
-                "artist":   currentsong.get("artist", "Unknown"),
-                "album":    currentsong.get("album",  ""),
-                "duration": float(status.get("duration", 0) or 0),
-                "elapsed":  float(status.get("elapsed",  0) or 0),
-                "state":    status.get("state", "stop"),
-                "shuffle":  status.get("random", "0") == "1",
-                "repeat":   status.get("repeat",  "0") == "1",
-            }
-            self.track_updated.emit(track)
-            self.playlists_updated.emit(playlists)
+            self._poll_status()
+            if self._polls % self.PLAYLISTS_EVERY_N_POLLS == 0:
+                self._poll_playlists()
+            self._polls += 1
         except Exception as e:
             log.warning(f"MPD poll error: {e}")
-            self._connected = False
+            self._disconnect()
+
+    def _poll_status(self):
+        # status + currentsong in one round trip
+        self._client.command_list_ok_begin()
+        self._client.status()
+        self._client.currentsong()
+        status, currentsong = self._client.command_list_end()
+
+        track = {
+            "title":    currentsong.get("title", "Unknown"),
+            "artist":   currentsong.get("artist", "Unknown"),
+            "album":    currentsong.get("album",  ""),
+            "duration": float(status.get("duration", 0) or 0),
+            "elapsed":  float(status.get("elapsed",  0) or 0),
+            "state":    status.get("state", "stop"),
+            "shuffle":  status.get("random", "0") == "1",
+            "repeat":   status.get("repeat",  "0") == "1",
+        }
+        self._playing = track["state"] == "play"
+        self.track_updated.emit(track)
 
-    def stop(self):
-        self._running = False
-        if self._client and self._connected:
+    def _poll_playlists(self):
+        playlists = [p["playlist"] for p in self._client.listplaylists()]
+        self.playlists_updated.emit(playlists)
+
+    def _disconnect(self):
+        self._idle_active = False
+        self._drop_idle_sock()
+        if self._client is not None:
             try: self._client.close()
             except: pass
+        self._connected = False
+
+    @pyqtSlot()
+    def stop(self):
+        """Runs on the I/O thread as it finishes."""
+        self._disconnect()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # WORKER: Moonraker / Klipper
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class MoonrakerWorker(QThread):
+class MoonrakerWorker(QObject):
+    """
+    Lives on the shared I/O thread. Prefers Moonraker's websocket: one
+    printer.objects.subscribe, then the server pushes deltas. Until that is
+    live (or without QtWebSockets) poll_now() falls back to the HTTP query.
+    """
     printer_updated = pyqtSignal(dict)
 
     ENDPOINT = (
         "http://{ip}:7125/printer/objects/query"
         "?print_stats&extruder=target,temperature&heater_bed=target,temperature"
     )
+    WS_ENDPOINT = "ws://{ip}:7125/websocket"
+    SUBSCRIBE_ID = 1
+    WS_MAX_MISSED = 2       # polls without a pong/frame (or handshake) before giving up
+    SUBSCRIBE_OBJECTS = {
+        "print_stats": ["state", "progress"],
+        "extruder":    ["temperature", "target"],
+        "heater_bed":  ["temperature", "target"],
+    }
+    # Give up on a query that stalls this long (e.g. printer powered off)
+    TIMEOUT_MS = 3000
 
     def __init__(self):
         super().__init__()
-        self._running = True
-
-    def run(self):
-        while self._running:
-            self._poll()
-            time.sleep(POLL_INTERVAL_MS_PRINTER / 1000)
-
-    def _poll(self):
-        if not REQUESTS_AVAILABLE:
-            self.printer_updated.emit(MOCK_PRINTER.copy())
-            return
-        url = self.ENDPOINT.format(ip=PRINTER_IP)
+        self._request = QNetworkRequest(QUrl(self.ENDPOINT.format(ip=PRINTER_IP)))
+        self._ws_url  = QUrl(self.WS_ENDPOINT.format(ip=PRINTER_IP))
+        self._nam     = None            # HTTP client, also created on the I/O thread
+        self._reply   = None            # HTTP query in flight
+        self._ws      = None            # created lazily on the I/O thread
+        self._ws_live = False           # subscribed, server is pushing updates
+        self._ws_missed = 0             # pings sent since the server was last heard
+        self._status  = {}              # raw Moonraker objects, merged from deltas
+        self._last    = None            # last published values, as shown
+
+    @pyqtSlot()
+    def poll_now(self):
+        if self._ws_live:
+            # A host that loses power leaves the socket half-open and
+            # `disconnected` never comes – ping, and give up if it stays silent
+            if self._ws_missed < self.WS_MAX_MISSED:
+                self._ws_missed += 1
+                self._ws.ping()
+                return
+            log.debug("Moonraker websocket silent, falling back to HTTP")
+            self._ws_live = False
+            self._ws.abort()
+        if WEBSOCKETS_AVAILABLE:
+            self._open_ws()
+        self._poll_http()
+
+    def _poll_http(self):
+        # Asynchronous – the I/O thread never blocks on the printer, and
+        # QNetworkAccessManager keeps the HTTP/1.1 connection alive between polls
+        if self._reply is not None:
+            return                      # previous query still in flight
+        if self._nam is None:
+            self._nam = QNetworkAccessManager(self)
+            self._nam.setTransferTimeout(self.TIMEOUT_MS)
+        self._reply = self._nam.get(self._request)
+        self._reply.finished.connect(self._on_http_reply)
+
+    @pyqtSlot()
+    def _on_http_reply(self):
+        reply, self._reply = self._reply, None
         try:
-            r = requests.get(url, timeout=3)
-            r.raise_for_status()
-            data   = r.json()["result"]["status"]
-            stats  = data.get("print_stats", {})
-            ext    = data.get("extruder",    {})
-            bed    = data.get("heater_bed",  {})
-            result = {
-                "state":         stats.get("state", "standby"),
-                "progress":      stats.get("progress", 0.0),
-                "hotend_temp":   ext.get("temperature", 0.0),
-                "hotend_target": ext.get("target",      0.0),
-                "bed_temp":      bed.get("temperature", 0.0),
-                "bed_target":    bed.get("target",      0.0),
-            }
-            self.printer_updated.emit(result)
+            if reply.error() != QNetworkReply.NoError:
+                raise IOError(reply.errorString())
+            self._publish(self._parse(json.loads(bytes(reply.readAll()))["result"]["status"]))
         except Exception as e:
             log.debug(f"Moonraker poll: {e}")
-            self.printer_updated.emit(MOCK_PRINTER.copy())
+            self._publish(MOCK_PRINTER.copy())
+        finally:
+            reply.deleteLater()
+
+    @staticmethod
+    def _parse(data: dict) -> dict:
+        stats  = data.get("print_stats", {})
+        ext    = data.get("extruder",    {})
+        bed    = data.get("heater_bed",  {})
+        return {
+            "state":         stats.get("state", "standby"),
+            "progress":      stats.get("progress", 0.0),
+            "hotend_temp":   ext.get("temperature", 0.0),
+            "hotend_target": ext.get("target",      0.0),
+            "bed_temp":      bed.get("temperature", 0.0),
+            "bed_target":    bed.get("target",      0.0),
+        }
+
+    def _publish(self, result: dict):
+        # Compare at the footer's resolution: Klipper pushes temperatures
+        # ~4×/s with 0.01° jitter, which would otherwise emit every time
+        shown = (
+            result["state"], round(result["progress"], 3),
+            round(result["hotend_temp"]), round(result["hotend_target"]),
+            round(result["bed_temp"]),    round(result["bed_target"]),
+        )
+        if shown != self._last:
+            self._last = shown
+            self.printer_updated.emit(result)
 
+    # ── Websocket push path ───────────────────────────────────────────────────
+    def _open_ws(self):
+        if self._ws is None:
+            self._ws = QWebSocket(parent=self)
+            self._ws.connected.connect(self._subscribe)
+            self._ws.disconnected.connect(self._on_ws_lost)
+            self._ws.textMessageReceived.connect(self._on_ws_message)
+            self._ws.pong.connect(self._on_ws_alive)
+        if self._ws.state() in (QAbstractSocket.HostLookupState, QAbstractSocket.ConnectingState):
+            # A refused or unanswered handshake on a kept-open TCP connection
+            # never leaves ConnectingState – give it a few polls, then retry
+            self._ws_missed += 1
+            if self._ws_missed < self.WS_MAX_MISSED:
+                return
+            self._ws.abort()
+        if self._ws.state() == QAbstractSocket.UnconnectedState:
+            self._ws_missed = 0
+            self._ws.open(self._ws_url)
+
+    @pyqtSlot()
+    def _subscribe(self):
+        self._ws.sendTextMessage(json.dumps({
+            "jsonrpc": "2.0",
+            "method":  "printer.objects.subscribe",
+            "params":  {"objects": self.SUBSCRIBE_OBJECTS},
+            "id":      self.SUBSCRIBE_ID,
+        }))
+
+    @pyqtSlot(str)
+    def _on_ws_message(self, text: str):
+        self._ws_missed = 0
+        # An exception escaping a slot aborts the app – drop odd frames instead
+        try:
+            msg = json.loads(text)
+            method = msg.get("method")
+            if method == "notify_status_update":
+                for obj, fields in msg["params"][0].items():
+                    self._status.setdefault(obj, {}).update(fields)
+                self._publish(self._parse(self._status))
+            elif msg.get("id") == self.SUBSCRIBE_ID and "result" in msg:
+                self._status  = msg["result"]["status"]
+                self._ws_live = True
+                self._publish(self._parse(self._status))
+            elif method == "notify_klippy_ready":
+                self._subscribe()
+            elif method in ("notify_klippy_disconnected", "notify_klippy_shutdown"):
+                self._ws_live = False   # HTTP fallback reports it until ready again
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            log.debug(f"Moonraker ws message: {e!r}")
+
+    def _on_ws_alive(self, *_):
+        self._ws_missed = 0
+
+    @pyqtSlot()
+    def _on_ws_lost(self):
+        self._ws_live = False
+
+    @pyqtSlot()
     def stop(self):
-        self._running = False
+        """Runs on the I/O thread as it finishes."""
+        if self._ws is not None:
+            self._ws.blockSignals(True)
+            self._ws.abort()
+        if self._reply is not None:
+            self._reply.blockSignals(True)
+            self._reply.abort()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SKYBLOCK TIMER LOGIC  (pure math, no network)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+SB_CULT_DAYS = (6, 13, 20, 27)     # Cult of the Fallen Star, 0-indexed within month
+
+SkyDate = namedtuple(
+    "SkyDate", "month day hour min sb_seconds_elapsed sb_time_of_day real_elapsed"
+)
+
+
 class SkyblockTimers:
     """All calculations happen here, no Qt dependency."""
 
@@ -345,29 +620,24 @@ class SkyblockTimers:
     REAL_SEC_PER_SB_MONTH= REAL_SEC_PER_SB_DAY * SB_DAYS_PER_MONTH  # 37200 s
     SB_SEC_PER_SB_DAY    = SB_HOURS_PER_DAY * 3600            # 86400 SB-sec
 
-    @classmethod
-    def real_to_sb(cls, real_epoch_s: float) -> dict:
-        """Convert real Unix seconds → Skyblock date/time."""
-        elapsed_real   = real_epoch_s - SB_EPOCH_MS / 1000
-        if elapsed_real < 0:
-            elapsed_real = 0
-        # How many SB-seconds have elapsed (scaled)
-        sb_seconds_elapsed = elapsed_real * cls.SB_SEC_PER_SB_DAY / cls.REAL_SEC_PER_SB_DAY
-        sb_total_days  = int(sb_seconds_elapsed // cls.SB_SEC_PER_SB_DAY)
-        sb_time_of_day = sb_seconds_elapsed % cls.SB_SEC_PER_SB_DAY   # 0..86399 SB-sec
-
-        sb_month = (sb_total_days // SB_DAYS_PER_MONTH) + 1
-        sb_day   = (sb_total_days %  SB_DAYS_PER_MONTH) + 1
-        sb_hour  = int(sb_time_of_day // 3600)
-        sb_min   = int((sb_time_of_day % 3600) // 60)
+    # Day index within the month → next cult day index (-1 = next month)
+    _NEXT_CULT_DAY = tuple(
+        next((d for d in SB_CULT_DAYS if d > i), -1) for i in range(SB_DAYS_PER_MONTH)
+    )
 
-        return {
-            "month": sb_month, "day": sb_day,
-            "hour": sb_hour, "min": sb_min,
-            "sb_seconds_elapsed": sb_seconds_elapsed,
-            "sb_time_of_day": sb_time_of_day,
-            "real_elapsed": elapsed_real,
-        }
+    @classmethod
+    def real_to_sb(cls, real_epoch_s: float) -> SkyDate:
+        """Convert real Unix seconds → Skyblock date/time, to the whole real second."""
+        # Whole real seconds × 72 is an exact SB-second count, so this stays
+        # in integer arithmetic throughout
+        elapsed_real = max(0, int(real_epoch_s) - SB_EPOCH_S)
+        sb_seconds_elapsed = elapsed_real * SB_SEC_PER_REAL_SEC
+        sb_total_days, sb_time_of_day = divmod(sb_seconds_elapsed, cls.SB_SEC_PER_SB_DAY)
+        sb_month, sb_day = divmod(sb_total_days, SB_DAYS_PER_MONTH)
+        sb_hour, sb_min  = divmod(sb_time_of_day // 60, 60)
+
+        return SkyDate(sb_month + 1, sb_day + 1, sb_hour, sb_min,
+                       sb_seconds_elapsed, sb_time_of_day, elapsed_real)
 
     @classmethod
     def next_cult_event(cls, real_now_s: float) -> float:
@@ -376,25 +646,19 @@ class SkyblockTimers:
         Event: SB day 7, 14, 21, 28  –  00:00 to 06:00 SB time.
         We aim for the 00:00 window start.
         """
-        sb = cls.real_to_sb(real_now_s)
-        elapsed_real = sb["real_elapsed"]
+        elapsed_real = max(0.0, real_now_s - SB_EPOCH_S)
 
         # Current position within one SB-month (real seconds)
         real_in_month  = elapsed_real % cls.REAL_SEC_PER_SB_MONTH
         real_per_day   = cls.REAL_SEC_PER_SB_DAY
 
-        # Find next cult day (7,14,21,28) at SB 00:00
-        event_days = [6, 13, 20, 27]   # 0-indexed within month
-        best = None
-        for d in event_days:
-            day_start = d * real_per_day
-            if day_start > real_in_month:
-                gap = day_start - real_in_month
-                if best is None or gap < best:
-                    best = gap
-        if best is None:
+        # Find next cult day (7,14,21,28) at SB 00:00 – one table lookup
+        nxt = cls._NEXT_CULT_DAY[int(real_in_month // real_per_day)]
+        if nxt >= 0:
+            best = nxt * real_per_day - real_in_month
+        else:
             # Wrap to next month
-            best = cls.REAL_SEC_PER_SB_MONTH - real_in_month + event_days[0] * real_per_day
+            best = cls.REAL_SEC_PER_SB_MONTH - real_in_month + SB_CULT_DAYS[0] * real_per_day
 
         return best   # real seconds remaining
 
@@ -414,48 +678,137 @@ class SkyblockTimers:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def make_placeholder_cover(size=220) -> QPixmap:
+    key = f"ph_cover_{size}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
     pix = QPixmap(size, size)
-    pix.fill(QColor(C["bg_elevated"]))
+    pix.fill(QC["bg_elevated"])
     painter = QPainter(pix)
     painter.setRenderHint(QPainter.Antialiasing)
 
     # Gradient circle
     grad = QRadialGradient(size/2, size/2, size/2)
-    grad.setColorAt(0.0, QColor("#1db95440"))
-    grad.setColorAt(1.0, QColor("#00000000"))
+    grad.setColorAt(0.0, QC_ACCENT_ALPHA40)
+    grad.setColorAt(1.0, QColor(Qt.transparent))
     painter.setBrush(QBrush(grad))
     painter.setPen(Qt.NoPen)
     painter.drawEllipse(10, 10, size-20, size-20)
 
     # Music note icon (simple)
-    painter.setPen(QPen(QColor(C["accent"]), 3))
-    painter.setFont(QFont("serif", size//4))
+    painter.setPen(QPen(QC["accent"], 3))
+    painter.setFont(_cached_font("serif", size//4))
     painter.drawText(pix.rect(), Qt.AlignCenter, "♫")
     painter.end()
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
+def glyph_pixmap(text, color=None, size=11) -> QPixmap:
+    """Rasterise a symbol/emoji once; labels then blit it instead of shaping text."""
+    c   = color or C["text_primary"]
+    key = f"glyph_{text}_{c}_{size}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
+    font = _cached_font(None, size)
+    fm   = QFontMetrics(font)
+    pix  = QPixmap(max(1, fm.horizontalAdvance(text)), fm.height())
+    pix.fill(Qt.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(c))
+    painter.drawText(pix.rect(), Qt.AlignCenter, text)
+    painter.end()
+    QPixmapCache.insert(key, pix)
     return pix
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_font(family, size) -> QFont:
+    """family=None → application font at `size` px; otherwise `family` at `size` pt."""
+    if family is None:
+        font = QFont()
+        font.setPixelSize(size)
+        return font
+    return QFont(family, size)
+
+
 def fmt_time(seconds: float) -> str:
-    s = int(seconds)
-    return f"{s//3600:02d}:{(s%3600)//60:02d}:{s%60:02d}" if s >= 3600 else f"{s//60:02d}:{s%60:02d}"
+    return _fmt_clock(max(0, int(seconds)), False)
 
 
 def fmt_countdown(seconds: float) -> str:
-    s = max(0, int(seconds))
-    h, rem = divmod(s, 3600)
-    m, sec = divmod(rem, 60)
-    return f"{h:02d}:{m:02d}:{sec:02d}"
+    return _fmt_clock(max(0, int(seconds)), True)
+
+
+# "MM:SS" for every second of an hour (~200 KB); hours go in front of it
+_MMSS = tuple(f"{m:02d}:{sec:02d}" for m in range(60) for sec in range(60))
+
+
+def _fmt_clock(s: int, hours: bool) -> str:
+    """MM:SS (HH:MM:SS past an hour, or always if hours=True)."""
+    h, r = divmod(s, 3600)
+    if hours or h:
+        return f"{h:02d}:{_MMSS[r]}"
+    return _MMSS[r]
+
+
+# Sidebar tick formats, bound once
+_SB_FMT        = "SB {:02d}:{:02d}  Day {}".format
+_CULT_DATE_FMT = "In {}h {}m real time".format
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UI COMPONENTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def label(text="", color=None, size=11, bold=False, parent=None) -> QLabel:
-    lbl = QLabel(text, parent)
-    c   = color or C["text_primary"]
-    w   = "bold" if bold else "normal"
-    lbl.setStyleSheet(f"color: {c}; font-size: {size}px; font-weight: {w}; background: transparent;")
+@functools.lru_cache(maxsize=64)
+def _label_qss(color, size, bold) -> str:
+    w = "bold" if bold else "normal"
+    return f"color: {color}; font-size: {size}px; font-weight: {w}; background: transparent;"
+
+
+def label(text="", color=None, size=11, bold=False, parent=None, cls=QLabel) -> QLabel:
+    lbl = cls(text, parent)
+    lbl.setStyleSheet(_label_qss(color or C["text_primary"], size, bold))
+    return lbl
+
+
+def set_text_if_changed(cache: dict, key: str, lbl: QLabel, text: str):
+    """setText only when text differs from cache[key], the last value shown."""
+    if cache.get(key) != text:
+        lbl.setText(text)
+        cache[key] = text
+
+
+class CardLabel(QLabel):
+    """Label that fills its own bg_card background, so a setText repaints
+    just the label and not the card behind it."""
+
+    def event(self, e):
+        handled = super().event(e)
+        if e.type() == QEvent.Polish:
+            # Style-sheet polishing clears the attribute (the label qss says
+            # "background: transparent"), so set it once that is done
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+        return handled
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.fillRect(self.rect(), QC["bg_card"])
+        p.end()
+        super().paintEvent(event)
+
+
+def glyph_label(text, color=None, size=11, parent=None) -> QLabel:
+    """Static icon label – shows a cached glyph_pixmap() instead of text."""
+    lbl = QLabel(parent)
+    lbl.setPixmap(glyph_pixmap(text, color, size))
+    lbl.setStyleSheet("background: transparent;")
     return lbl
 
 
@@ -468,6 +821,8 @@ class SeparatorLine(QFrame):
 
 class AnimatedProgressBar(QWidget):
     """Custom progress bar with glow effect."""
+    _grad_pm = None     # shared 256×h fill gradient, built on first paint
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._value = 0.0
@@ -475,26 +830,40 @@ class AnimatedProgressBar(QWidget):
         self.setStyleSheet("background: transparent;")
 
     def setValue(self, v: float):
-        self._value = max(0.0, min(1.0, v))
-        self.update()
+        v = max(0.0, min(1.0, v))
+        w = self.width()
+        old_fill = int(w * self._value)
+        self._value = v
+        # Repaint only when the filled width moves by at least one pixel
+        if int(w * v) != old_fill:
+            self.update()
+
+    @classmethod
+    def _gradient_pixmap(cls, h: int) -> QPixmap:
+        pm = cls._grad_pm
+        if pm is None or pm.height() != h:
+            pm = QPixmap(256, h)
+            grad = QLinearGradient(0, 0, pm.width(), 0)
+            grad.setColorAt(0,   QC["accent"])
+            grad.setColorAt(1.0, QColor("#3dffa0"))
+            p = QPainter(pm)
+            p.fillRect(pm.rect(), QBrush(grad))
+            p.end()
+            cls._grad_pm = pm
+        return pm
 
     def paintEvent(self, event):
+        # 4 px tall: plain fills, no antialiasing, no per-paint gradient
         w = self.width()
         h = self.height()
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
         # Track
-        p.setBrush(QColor(C["progress_bg"]))
-        p.setPen(Qt.NoPen)
-        p.drawRoundedRect(0, 0, w, h, 2, 2)
-        # Fill
+        p.fillRect(0, 0, w, h, QC["progress_bg"])
+        # Fill – stretch the cached gradient over the filled width
         fill_w = int(w * self._value)
         if fill_w > 0:
-            grad = QLinearGradient(0, 0, fill_w, 0)
-            grad.setColorAt(0,   QColor(C["accent"]))
-            grad.setColorAt(1.0, QColor("#3dffa0"))
-            p.setBrush(QBrush(grad))
-            p.drawRoundedRect(0, 0, fill_w, h, 2, 2)
+            pm = self._gradient_pixmap(h)
+            p.drawPixmap(QRect(0, 0, fill_w, h), pm, QRect(0, 0, pm.width(), h))
         p.end()
 
 
@@ -511,6 +880,7 @@ class NowPlayingView(QWidget):
         super().__init__(parent)
         self._shuffle = False
         self._loop    = False
+        self._last    = {}     # last value shown per field, see update_track
         self._build_ui()
 
     def _build_ui(self):
@@ -562,29 +932,44 @@ class NowPlayingView(QWidget):
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
 
-        def ctrl_btn(symbol, tip, slot, accent=False):
-            b = QPushButton(symbol)
-            col = C["accent"] if accent else C["text_secondary"]
-            b.setStyleSheet(f"""
+        def ctrl_qss(col, px=40):
+            return f"""
                 QPushButton {{
                     color: {col}; background: transparent;
-                    border: 1px solid {C['border']}; border-radius: 20px;
-                    font-size: 18px; min-width: 40px; min-height: 40px;
-                    max-width: 40px; max-height: 40px;
+                    border: 1px solid {C['border']}; border-radius: {px // 2}px;
+                    font-size: 18px; min-width: {px}px; min-height: {px}px;
+                    max-width: {px}px; max-height: {px}px;
                 }}
                 QPushButton:hover {{ background: {C['bg_elevated']}; color: {C['accent']}; }}
                 QPushButton:pressed {{ background: {C['accent']}20; }}
-            """)
+            """
+
+        # Symbols are rasterised once into icons; toggles and play/pause just
+        # swap icons instead of re-shaping glyph text
+        def icon(symbol, col):
+            return QIcon(glyph_pixmap(symbol, col, 18))
+
+        dim, acc = C["text_secondary"], C["accent"]
+        self._icon_play    = icon("▶", acc)
+        self._icon_pause   = icon("⏸", acc)
+        self._icon_shuffle = (icon("⇌", dim), icon("⇌", acc))
+        self._icon_loop    = (icon("↻", dim), icon("↻", acc))
+        icon_size = glyph_pixmap("▶", acc, 18).size()
+
+        def ctrl_btn(ico, tip, slot, px=40):
+            b = QPushButton()
+            b.setIcon(ico)
+            b.setIconSize(icon_size)
+            b.setStyleSheet(ctrl_qss(dim, px))
             b.setToolTip(tip)
             b.clicked.connect(slot)
             return b
 
-        self.shuffle_btn = ctrl_btn("⇌", "Shuffle [4]", self._on_shuffle)
-        self.prev_btn    = ctrl_btn("⏮", "Prev [3]",    self.prev_requested.emit)
-        self.play_btn    = ctrl_btn("▶", "Play/Pause [1]", self.play_pause_requested.emit, accent=True)
-        self.play_btn.setStyleSheet(self.play_btn.styleSheet().replace("min-width: 40px; min-height: 40px; max-width: 40px; max-height: 40px", "min-width:48px; min-height:48px; max-width:48px; max-height:48px"))
-        self.next_btn    = ctrl_btn("⏭", "Next [2]",    self.next_requested.emit)
-        self.loop_btn    = ctrl_btn("↻", "Loop [5]",    self._on_loop)
+        self.shuffle_btn = ctrl_btn(self._icon_shuffle[0], "Shuffle [4]", self._on_shuffle)
+        self.prev_btn    = ctrl_btn(icon("⏮", dim), "Prev [3]", self.prev_requested.emit)
+        self.play_btn    = ctrl_btn(self._icon_play, "Play/Pause [1]", self.play_pause_requested.emit, px=48)
+        self.next_btn    = ctrl_btn(icon("⏭", dim), "Next [2]", self.next_requested.emit)
+        self.loop_btn    = ctrl_btn(self._icon_loop[0], "Loop [5]", self._on_loop)
 
         for b in [self.shuffle_btn, self.prev_btn, self.play_btn, self.next_btn, self.loop_btn]:
             btn_row.addStretch(1)
@@ -595,33 +980,28 @@ class NowPlayingView(QWidget):
 
     def _on_shuffle(self):
         self._shuffle = not self._shuffle
-        col = C["accent"] if self._shuffle else C["text_secondary"]
-        self.shuffle_btn.setStyleSheet(self.shuffle_btn.styleSheet().replace(
-            self.shuffle_btn.styleSheet().split("color:")[1].split(";")[0],
-            f" {col}"
-        ))
+        self.shuffle_btn.setIcon(self._icon_shuffle[self._shuffle])
         self.shuffle_requested.emit()
 
     def _on_loop(self):
         self._loop = not self._loop
-        col = C["accent"] if self._loop else C["text_secondary"]
-        self.loop_btn.setStyleSheet(self.loop_btn.styleSheet().replace(
-            self.loop_btn.styleSheet().split("color:")[1].split(";")[0],
-            f" {col}"
-        ))
+        self.loop_btn.setIcon(self._icon_loop[self._loop])
         self.loop_requested.emit()
 
     def update_track(self, track: dict):
-        self.title_lbl.setText(track.get("title", "—"))
-        self.artist_lbl.setText(track.get("artist", ""))
-        self.album_lbl.setText(track.get("album", ""))
+        # Title/artist/album hold for the whole song – only touch what changed
+        set_text_if_changed(self._last, "title",    self.title_lbl,    track.get("title", "—"))
+        set_text_if_changed(self._last, "artist",   self.artist_lbl,   track.get("artist", ""))
+        set_text_if_changed(self._last, "album",    self.album_lbl,    track.get("album", ""))
         elapsed  = track.get("elapsed",  0)
         duration = track.get("duration", 0)
-        self.elapsed_lbl.setText(fmt_time(elapsed))
-        self.duration_lbl.setText(fmt_time(duration))
+        set_text_if_changed(self._last, "elapsed",  self.elapsed_lbl,  fmt_time(elapsed))
+        set_text_if_changed(self._last, "duration", self.duration_lbl, fmt_time(duration))
         self.progress_bar.setValue(elapsed / duration if duration else 0)
-        state = track.get("state", "stop")
-        self.play_btn.setText("⏸" if state == "play" else "▶")
+        playing = track.get("state", "stop") == "play"
+        if self._last.get("playing") != playing:
+            self.play_btn.setIcon(self._icon_pause if playing else self._icon_play)
+            self._last["playing"] = playing
 
         self._shuffle = track.get("shuffle", False)
         self._loop    = track.get("repeat",  False)
@@ -642,62 +1022,84 @@ class PlaylistView(QWidget):
         hdr.setStyleSheet(hdr.styleSheet() + "letter-spacing: 2px;")
         layout.addWidget(hdr)
 
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet(f"""
-            QListWidget {{
+        # Plain string model: a refresh is one model reset, no per-row items
+        self._model = QStringListModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self._model)
+        self.list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.list_view.setStyleSheet(f"""
+            QListView {{
                 background: transparent; border: none;
                 color: {C['text_primary']}; font-size: 13px;
                 outline: none;
             }}
-            QListWidget::item {{
+            QListView::item {{
                 padding: 10px 8px; border-radius: 6px;
                 border-bottom: 1px solid {C['border']};
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background: {C['accent']}22; color: {C['accent']};
                 border: 1px solid {C['accent']}44;
             }}
-            QListWidget::item:hover {{
+            QListView::item:hover {{
                 background: {C['bg_elevated']};
             }}
         """)
-        self.list_widget.itemActivated.connect(lambda item: self.playlist_selected.emit(item.text()))
-        layout.addWidget(self.list_widget)
+        self.list_view.activated.connect(lambda index: self.playlist_selected.emit(index.data()))
+        layout.addWidget(self.list_view)
 
         hint = label("↑/↓ scroll  •  Enter select  •  Enter toggle view", C["text_dim"], 9)
         hint.setAlignment(Qt.AlignCenter)
         layout.addWidget(hint)
 
+    def _current_row(self) -> int:
+        return self.list_view.currentIndex().row()
+
+    def _set_current_row(self, row: int):
+        self.list_view.setCurrentIndex(self._model.index(row))
+
     def update_playlists(self, playlists: list):
-        current = self.list_widget.currentRow()
-        self.list_widget.clear()
-        for pl in playlists:
-            item = QListWidgetItem(pl)
-            self.list_widget.addItem(item)
-        if current >= 0 and current < self.list_widget.count():
-            self.list_widget.setCurrentRow(current)
-        elif self.list_widget.count():
-            self.list_widget.setCurrentRow(0)
+        if self._model.stringList() == playlists:
+            return
+        current = self._current_row()
+        self._model.setStringList(playlists)
+        count = self._model.rowCount()
+        if current >= 0 and current < count:
+            self._set_current_row(current)
+        elif count:
+            self._set_current_row(0)
 
     def scroll_up(self):
-        r = self.list_widget.currentRow()
+        r = self._current_row()
         if r > 0:
-            self.list_widget.setCurrentRow(r - 1)
+            self._set_current_row(r - 1)
 
     def scroll_down(self):
-        r = self.list_widget.currentRow()
-        if r < self.list_widget.count() - 1:
-            self.list_widget.setCurrentRow(r + 1)
+        r = self._current_row()
+        if r < self._model.rowCount() - 1:
+            self._set_current_row(r + 1)
+
+    def current_playlist(self):
+        """Name of the highlighted playlist, or None."""
+        index = self.list_view.currentIndex()
+        return index.data() if index.isValid() else None
 
     def activate_current(self):
-        item = self.list_widget.currentItem()
-        if item:
-            self.playlist_selected.emit(item.text())
+        name = self.current_playlist()
+        if name:
+            self.playlist_selected.emit(name)
 
 
 # ─── Printer Footer ───────────────────────────────────────────────────────────
 
 class PrinterFooter(QWidget):
+    # State label stylesheets, built once – anything else uses the idle one
+    _STATE_QSS_IDLE = f"color:{C['text_dim']}; font-size:10px; font-weight:bold; background:transparent;"
+    _STATE_QSS = {
+        "PRINTING": f"color:{C['accent']}; font-size:10px; font-weight:bold; background:transparent;",
+        "PAUSED":   f"color:{C['accent2']}; font-size:10px; font-weight:bold; background:transparent;",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(48)
@@ -707,7 +1109,7 @@ class PrinterFooter(QWidget):
         row.setContentsMargins(16, 0, 16, 0)
         row.setSpacing(24)
 
-        printer_icon = label("🖨", size=14)
+        printer_icon = glyph_label("🖨", size=14)
         row.addWidget(printer_icon)
 
         self.state_lbl      = label("STANDBY",   C["text_dim"],       10, bold=True)
@@ -724,22 +1126,28 @@ class PrinterFooter(QWidget):
         row.addWidget(self.progress_lbl)
         row.addWidget(self.progress_mini)
 
+        self._last = {}     # last value shown per field, see update_printer
+
     def update_printer(self, data: dict):
+        # Only touch widgets whose shown value changed (idle printer: none)
         state = data.get("state", "standby").upper()
-        color = C["accent"] if state == "PRINTING" else (C["accent2"] if state == "PAUSED" else C["text_dim"])
-        self.state_lbl.setText(state)
-        self.state_lbl.setStyleSheet(f"color:{color}; font-size:10px; font-weight:bold; background:transparent;")
+        if self._last.get("state") != state:
+            self.state_lbl.setText(state)
+            self.state_lbl.setStyleSheet(self._STATE_QSS.get(state, self._STATE_QSS_IDLE))
+            self._last["state"] = state
 
         ht  = data.get("hotend_temp",  0.0)
         htg = data.get("hotend_target",0.0)
         bt  = data.get("bed_temp",     0.0)
         btg = data.get("bed_target",   0.0)
-        self.hotend_lbl.setText(f"🔥 {ht:.0f}° / {htg:.0f}°")
-        self.bed_lbl.setText(   f"🛏 {bt:.0f}° / {btg:.0f}°")
+        set_text_if_changed(self._last, "hotend", self.hotend_lbl, f"🔥 {ht:.0f}° / {htg:.0f}°")
+        set_text_if_changed(self._last, "bed",    self.bed_lbl,    f"🛏 {bt:.0f}° / {btg:.0f}°")
 
         prog = data.get("progress", 0.0)
-        self.progress_lbl.setText(f"{prog*100:.1f}%")
-        self.progress_mini.setValue(prog)
+        set_text_if_changed(self._last, "progress", self.progress_lbl, f"{prog*100:.1f}%")
+        if self._last.get("progress_value") != prog:
+            self.progress_mini.setValue(prog)
+            self._last["progress_value"] = prog
 
 
 # ─── Skyblock Sidebar ─────────────────────────────────────────────────────────
@@ -748,6 +1156,12 @@ class SkyblockSidebar(QWidget):
     def __init__(self, free_will_anchor: float, parent=None):
         super().__init__(parent)
         self._anchor = free_will_anchor
+        # Absolute times of the next cult start / Free Will reset; the tick
+        # just subtracts until one passes, then asks SkyblockTimers again
+        self._next_cult_ts = 0.0
+        self._fw_next_ts   = 0.0
+        self._fw_permille  = 1000 / (FREE_WILL_CYCLE_HRS * 3600)   # remaining s → ‰
+        self._last = {}     # last text shown per label, see update_timers
         self.setFixedWidth(200)
         self.setStyleSheet(f"background: {C['bg_card']}; border-left: 1px solid {C['border']};")
         self._build_ui()
@@ -768,12 +1182,12 @@ class SkyblockSidebar(QWidget):
         cult_layout.setContentsMargins(0,0,0,0)
         cult_layout.setSpacing(4)
 
-        cult_icon  = label("☄", C["accent3"], 22)
+        cult_icon  = glyph_label("☄", C["accent3"], 22)
         cult_title = label("Cult of the\nFallen Star", C["text_primary"], 11, bold=True)
         cult_title.setWordWrap(True)
 
-        self.cult_sb_time  = label("SB --:--", C["text_secondary"], 9)
-        self.cult_countdown= label("--:--:--",   C["accent3"],       20, bold=True)
+        self.cult_sb_time  = label("SB --:--", C["text_secondary"], 9, cls=CardLabel)
+        self.cult_countdown= label("--:--:--",   C["accent3"],       20, bold=True, cls=CardLabel)
         self.cult_date_lbl = label("Next: ...",  C["text_dim"],       9)
 
         cult_layout.addWidget(cult_icon)
@@ -791,11 +1205,11 @@ class SkyblockSidebar(QWidget):
         fw_layout.setContentsMargins(0,0,0,0)
         fw_layout.setSpacing(4)
 
-        fw_icon  = label("⧗", C["accent2"], 22)
+        fw_icon  = glyph_label("⧗", C["accent2"], 22)
         fw_title = label("Free Will\n/ Rift",    C["text_primary"], 11, bold=True)
         fw_title.setWordWrap(True)
 
-        self.fw_countdown   = label("--:--:--",  C["accent2"], 20, bold=True)
+        self.fw_countdown   = label("--:--:--",  C["accent2"], 20, bold=True, cls=CardLabel)
         self.fw_progress    = AnimatedProgressBar()
         self.fw_cycle_label = label(f"Cycle: {FREE_WILL_CYCLE_HRS}h", C["text_dim"], 9)
 
@@ -813,23 +1227,35 @@ class SkyblockSidebar(QWidget):
         layout.addWidget(hint)
 
     def update_timers(self):
+        # No setUpdatesEnabled() bracket here: Qt already merges the labels'
+        # update()s into one paint pass, and re-enabling would repaint the
+        # whole sidebar (separators, progress bar) every tick.
         now = time.time()
         sb  = SkyblockTimers.real_to_sb(now)
 
         # Cult
-        cult_remaining = SkyblockTimers.next_cult_event(now)
-        self.cult_countdown.setText(fmt_countdown(cult_remaining))
-        self.cult_sb_time.setText(f"SB {sb['hour']:02d}:{sb['min']:02d}  Day {sb['day']}")
-        # Approximate next cult day
-        cult_h = int(cult_remaining // 3600)
-        cult_m = int((cult_remaining % 3600) // 60)
-        self.cult_date_lbl.setText(f"In {cult_h}h {cult_m}m real time")
+        if now >= self._next_cult_ts:
+            self._next_cult_ts = now + SkyblockTimers.next_cult_event(now)
+        cult_remaining = self._next_cult_ts - now
+        set_text_if_changed(self._last, "cult", self.cult_countdown, fmt_countdown(cult_remaining))
+        # An SB minute is 60/72 real s, so this changes on every tick anyway
+        set_text_if_changed(self._last, "sb", self.cult_sb_time, _SB_FMT(sb.hour, sb.min, sb.day))
+        # Approximate next cult day – minute resolution, only format on change
+        cult_hm = divmod(int(cult_remaining) // 60, 60)
+        if self._last.get("cult_hm") != cult_hm:
+            self.cult_date_lbl.setText(_CULT_DATE_FMT(*cult_hm))
+            self._last["cult_hm"] = cult_hm
 
         # Free Will
-        fw_remaining = SkyblockTimers.free_will_remaining(now, self._anchor)
-        fw_total     = FREE_WILL_CYCLE_HRS * 3600
-        self.fw_countdown.setText(fmt_countdown(fw_remaining))
-        self.fw_progress.setValue(fw_remaining / fw_total)
+        if now >= self._fw_next_ts:
+            self._fw_next_ts = now + SkyblockTimers.free_will_remaining(now, self._anchor)
+        fw_remaining = self._fw_next_ts - now
+        set_text_if_changed(self._last, "fw", self.fw_countdown, fmt_countdown(fw_remaining))
+        # Per-mille is finer than the bar's pixels but moves only every ~6 min
+        fw_pm = int(fw_remaining * self._fw_permille)
+        if self._last.get("fw_pm") != fw_pm:
+            self.fw_progress.setValue(fw_pm / 1000)
+            self._last["fw_pm"] = fw_pm
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -840,6 +1266,21 @@ class MainWindow(QMainWindow):
     VIEW_NOW_PLAYING = 0
     VIEW_PLAYLISTS   = 1
 
+    # Window-wide stylesheet, built once
+    _STYLESHEET = f"""
+        QMainWindow, QWidget {{
+            background-color: {C['bg']};
+            color: {C['text_primary']};
+            font-family: 'Noto Sans', 'DejaVu Sans', sans-serif;
+        }}
+        QScrollBar:vertical {{
+            background: {C['bg_card']}; width: 6px; border: none;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {C['border']}; border-radius: 3px;
+        }}
+    """
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Custom Player")
@@ -847,9 +1288,15 @@ class MainWindow(QMainWindow):
         self._current_view   = self.VIEW_NOW_PLAYING
         self._sidebar_visible= True
         self._current_track  = MOCK_TRACK.copy()
+        self._playlists      = []
+        self._closing        = False
 
         # Free Will anchor = now (first launch; persist across runs via a file if needed)
         self._fw_anchor = time.time()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1000)
+        self._save_timer.timeout.connect(self._do_save_fw_anchor)
         self._load_fw_anchor()
 
         self._build_ui()
@@ -860,20 +1307,37 @@ class MainWindow(QMainWindow):
 
     # ── Free-will anchor persistence ─────────────────────────────────────────
     def _anchor_path(self):
-        return os.path.join(os.path.dirname(__file__), ".fw_anchor")
+        return FW_ANCHOR_PATH
 
     def _load_fw_anchor(self):
+        # A few bytes – a raw fd read skips the TextIOWrapper setup
         try:
-            with open(self._anchor_path()) as f:
-                self._fw_anchor = float(f.read().strip())
-        except:
+            fd = os.open(self._anchor_path(), os.O_RDONLY)
+            try:
+                data = os.read(fd, 64)
+            finally:
+                os.close(fd)
+            self._fw_anchor = float(data)
+        except (OSError, ValueError):
             self._save_fw_anchor()
 
     def _save_fw_anchor(self):
+        # Coalesce: the write happens ~1 s after the last change (or on close)
+        self._save_timer.start()
+
+    def _do_save_fw_anchor(self):
+        path = self._anchor_path()
+        tmp  = path + ".tmp"
         try:
-            with open(self._anchor_path(), "w") as f:
-                f.write(str(self._fw_anchor))
-        except: pass
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, str(self._fw_anchor).encode())
+                getattr(os, "fdatasync", os.fsync)(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except OSError:
+            pass
 
     # ── UI construction ───────────────────────────────────────────────────────
     def _build_ui(self):
@@ -887,13 +1351,13 @@ class MainWindow(QMainWindow):
         content_row = QHBoxLayout()
         content_row.setSpacing(0)
 
-        # Main stacked area
+        # Main stacked area – only the start view is built now, the rest on
+        # first switch (see _view); keeps startup widget count down
         self.main_stack = QStackedWidget()
         self.now_playing = NowPlayingView()
-        self.playlist_view = PlaylistView()
         self.main_stack.addWidget(self.now_playing)
-        self.main_stack.addWidget(self.playlist_view)
-        self.main_stack.setCurrentIndex(self.VIEW_NOW_PLAYING)
+        self._views = {self.VIEW_NOW_PLAYING: self.now_playing}
+        self._view_factories = {self.VIEW_PLAYLISTS: self._make_playlist_view}
         content_row.addWidget(self.main_stack, 1)
 
         # Sidebar
@@ -906,40 +1370,56 @@ class MainWindow(QMainWindow):
         self.footer = PrinterFooter()
         root.addWidget(self.footer)
 
+    def _view(self, key) -> QWidget:
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = self._view_factories[key]()
+            self.main_stack.addWidget(view)
+        return view
+
+    def _make_playlist_view(self) -> PlaylistView:
+        view = PlaylistView()
+        view.update_playlists(self._playlists)
+        view.playlist_selected.connect(self.mopidy_worker.play_playlist)
+        return view
+
     def _apply_stylesheet(self):
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{
-                background-color: {C['bg']};
-                color: {C['text_primary']};
-                font-family: 'Noto Sans', 'DejaVu Sans', sans-serif;
-            }}
-            QScrollBar:vertical {{
-                background: {C['bg_card']}; width: 6px; border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {C['border']}; border-radius: 3px;
-            }}
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
     # ── Workers ───────────────────────────────────────────────────────────────
     def _wire_workers(self):
+        # Both workers share one I/O thread; MainWindow._on_tick requests
+        # their polls instead of each worker sleeping in its own thread.
+        self.io_thread = QThread(self)
+
         self.mopidy_worker = MopidyWorker()
-        self.mopidy_worker.track_updated.connect(self._on_track_update)
-        self.mopidy_worker.playlists_updated.connect(self.playlist_view.update_playlists)
-        self.mopidy_worker.start()
+        self.mopidy_worker.track_updated.connect(self._on_track_update, Qt.QueuedConnection)
+        self.mopidy_worker.playlists_updated.connect(self._on_playlists_update, Qt.QueuedConnection)
+        self.mopidy_worker.moveToThread(self.io_thread)
+        self.io_thread.started.connect(self.mopidy_worker.poll_now)
+        self.io_thread.finished.connect(self.mopidy_worker.stop)
 
         self.printer_worker = MoonrakerWorker()
-        self.printer_worker.printer_updated.connect(self.footer.update_printer)
-        self.printer_worker.start()
+        self.printer_worker.printer_updated.connect(self.footer.update_printer, Qt.QueuedConnection)
+        self.printer_worker.moveToThread(self.io_thread)
+        self.io_thread.started.connect(self.printer_worker.poll_now)
+        self.io_thread.finished.connect(self.printer_worker.stop)
+
+        # Spin the I/O thread up once the event loop runs, after the first paint
+        QTimer.singleShot(0, self._start_io)
 
         # Wire now-playing controls → worker
         np = self.now_playing
         np.play_pause_requested.connect(self.mopidy_worker.play_pause)
         np.next_requested.connect(self.mopidy_worker.next_track)
         np.prev_requested.connect(self.mopidy_worker.prev_track)
-        np.shuffle_requested.connect(lambda: self.mopidy_worker.shuffle(not self._current_track.get("shuffle")))
-        np.loop_requested.connect(lambda: self.mopidy_worker.loop(not self._current_track.get("repeat")))
-        self.playlist_view.playlist_selected.connect(self.mopidy_worker.play_playlist)
+        np.shuffle_requested.connect(self._toggle_shuffle)
+        np.loop_requested.connect(self._toggle_loop)
+
+    def _start_io(self):
+        # Unless the window was already closed before the loop got here
+        if not self._closing:
+            self.io_thread.start()
 
     # ── Input handler ─────────────────────────────────────────────────────────
     def _wire_input(self):
@@ -953,8 +1433,8 @@ class MainWindow(QMainWindow):
         ih.btn_play_pause.connect(self.mopidy_worker.play_pause)
         ih.btn_next.connect(self.mopidy_worker.next_track)
         ih.btn_prev.connect(self.mopidy_worker.prev_track)
-        ih.btn_shuffle.connect(lambda: self.mopidy_worker.shuffle(not self._current_track.get("shuffle")))
-        ih.btn_loop.connect(lambda: self.mopidy_worker.loop(not self._current_track.get("repeat")))
+        ih.btn_shuffle.connect(self._toggle_shuffle)
+        ih.btn_loop.connect(self._toggle_loop)
         ih.btn_sidebar_toggle.connect(self._toggle_sidebar)
 
     # ── Qt Key forwarding ─────────────────────────────────────────────────────
@@ -964,44 +1444,107 @@ class MainWindow(QMainWindow):
 
     # ── Timers ────────────────────────────────────────────────────────────────
     def _start_timers(self):
-        self._sb_timer = QTimer(self)
-        self._sb_timer.timeout.connect(self.sidebar.update_timers)
-        self._sb_timer.start(POLL_INTERVAL_MS_SKYBLOCK)
+        # One timer for everything: the sidebar runs every tick, the worker
+        # polls on multiples of it – fewer independent CPU wakeups. It is
+        # single-shot and re-armed for the next whole second, when the
+        # countdowns actually change, rather than free-running. Coarse, so
+        # the kernel can batch it with other wakeups; see _schedule_tick.
+        self._n = 0
+        self._tick = QTimer(self)
+        self._tick.setSingleShot(True)
+        self._tick.setTimerType(Qt.CoarseTimer)
+        self._tick.timeout.connect(self._on_tick)
+        self.sidebar.update_timers()
+        self._schedule_tick()
+
+        # Track payloads arriving in a burst (idle wake-up, post-command
+        # repoll, regular poll) are folded into one view update
+        self._pending_track = None
+        self._track_refresh = QTimer(self)
+        self._track_refresh.setSingleShot(True)
+        self._track_refresh.setInterval(100)
+        self._track_refresh.timeout.connect(self._drain_track)
+
+    def _schedule_tick(self):
+        # Aim past the boundary by more than the coarse slack (±5 %), so an
+        # early fire still lands after the second has rolled over
+        now_ms = int(time.time() * 1000)
+        self._tick.start(POLL_INTERVAL_MS_SKYBLOCK - now_ms % POLL_INTERVAL_MS_SKYBLOCK
+                         + TICK_SLACK_MS)
+
+    def _on_tick(self):
+        self._n += 1
+        if self._sidebar_visible:
+            self.sidebar.update_timers()
+        if self._n % TICKS_PER_SPOTIFY_POLL == 0:
+            self._request_poll(self.mopidy_worker)
+        if self._n % TICKS_PER_PRINTER_POLL == 0:
+            self._request_poll(self.printer_worker)
+        self._schedule_tick()
+
+    @staticmethod
+    def _request_poll(worker):
+        QMetaObject.invokeMethod(worker, "poll_now", Qt.QueuedConnection)
 
     # ── Slots ─────────────────────────────────────────────────────────────────
     def _on_track_update(self, track: dict):
-        self._current_track = track
-        self.now_playing.update_track(track)
+        self._pending_track = track
+        if not self._track_refresh.isActive():
+            self._track_refresh.start()
+
+    def _drain_track(self):
+        track, self._pending_track = self._pending_track, None
+        if track is not None:
+            self._current_track = track
+            self.now_playing.update_track(track)
+
+    def _on_playlists_update(self, playlists: list):
+        self._playlists = playlists
+        view = self._views.get(self.VIEW_PLAYLISTS)
+        if view is not None:
+            view.update_playlists(playlists)
+
+    def _toggle_shuffle(self):
+        self.mopidy_worker.shuffle(not self._current_track.get("shuffle"))
+
+    def _toggle_loop(self):
+        self.mopidy_worker.loop(not self._current_track.get("repeat"))
 
     def _on_encoder_up(self):
         if self._current_view == self.VIEW_PLAYLISTS:
-            self.playlist_view.scroll_up()
+            self._view(self.VIEW_PLAYLISTS).scroll_up()
 
     def _on_encoder_down(self):
         if self._current_view == self.VIEW_PLAYLISTS:
-            self.playlist_view.scroll_down()
+            self._view(self.VIEW_PLAYLISTS).scroll_down()
 
     def _on_encoder_click(self):
         if self._current_view == self.VIEW_NOW_PLAYING:
             self._current_view = self.VIEW_PLAYLISTS
         else:
             # If a playlist is highlighted, play it; then switch back
-            item = self.playlist_view.list_widget.currentItem()
-            if item:
-                self.mopidy_worker.play_playlist(item.text())
+            name = self._view(self.VIEW_PLAYLISTS).current_playlist()
+            if name:
+                self.mopidy_worker.play_playlist(name)
             self._current_view = self.VIEW_NOW_PLAYING
-        self.main_stack.setCurrentIndex(self._current_view)
+        self.main_stack.setCurrentWidget(self._view(self._current_view))
 
     def _toggle_sidebar(self):
         self._sidebar_visible = not self._sidebar_visible
+        if self._sidebar_visible:
+            self.sidebar.update_timers()    # skipped while hidden – catch up first
         self.sidebar.setVisible(self._sidebar_visible)
 
     # ── Cleanup ───────────────────────────────────────────────────────────────
     def closeEvent(self, event):
-        self.mopidy_worker.stop()
-        self.printer_worker.stop()
-        self.mopidy_worker.wait(2000)
-        self.printer_worker.wait(2000)
+        self._closing = True
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_fw_anchor()
+        # The workers have no loops to flag: quit() ends the I/O thread's event
+        # loop after the slot in progress, and `finished` runs their stop()
+        self.io_thread.quit()
+        self.io_thread.wait(4000)
         event.accept()
 
 
@@ -1017,18 +1560,19 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("CustomPlayer")
     app.setApplicationVersion("1.0.0")
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
 
     # Dark palette baseline
     palette = QPalette()
-    palette.setColor(QPalette.Window,          QColor(C["bg"]))
-    palette.setColor(QPalette.WindowText,      QColor(C["text_primary"]))
-    palette.setColor(QPalette.Base,            QColor(C["bg_card"]))
-    palette.setColor(QPalette.AlternateBase,   QColor(C["bg_elevated"]))
-    palette.setColor(QPalette.Text,            QColor(C["text_primary"]))
-    palette.setColor(QPalette.Button,          QColor(C["bg_elevated"]))
-    palette.setColor(QPalette.ButtonText,      QColor(C["text_primary"]))
-    palette.setColor(QPalette.Highlight,       QColor(C["accent"]))
-    palette.setColor(QPalette.HighlightedText, QColor(C["bg"]))
+    palette.setColor(QPalette.Window,          QC["bg"])
+    palette.setColor(QPalette.WindowText,      QC["text_primary"])
+    palette.setColor(QPalette.Base,            QC["bg_card"])
+    palette.setColor(QPalette.AlternateBase,   QC["bg_elevated"])
+    palette.setColor(QPalette.Text,            QC["text_primary"])
+    palette.setColor(QPalette.Button,          QC["bg_elevated"])
+    palette.setColor(QPalette.ButtonText,      QC["text_primary"])
+    palette.setColor(QPalette.Highlight,       QC["accent"])
+    palette.setColor(QPalette.HighlightedText, QC["bg"])
     app.setPalette(palette)
 
     window = MainWindow()